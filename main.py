@@ -13,7 +13,7 @@ from modules.debug import log_message, error_handler
 # data
 from modules.data import config_map
 # handlers
-from modules.handlers.command_handlers import STATE, start_cmd, help_cmd, settings_cmd, post_cmd, ban_cmd, reply_cmd,\
+from modules.handlers.command_handlers import State, start_cmd, help_cmd, settings_cmd, post_cmd, ban_cmd, reply_cmd,\
     clean_pending_cmd, post_msg, rules_cmd, sban_cmd, cancel_cmd, stats_cmd, forwarded_post_msg, report_post, report_cmd, \
     report_user_msg, report_user_sent_msg, purge_cmd
 from modules.handlers.callback_handlers import meme_callback, stats_callback
@@ -21,24 +21,27 @@ from modules.handlers.job_handlers import clean_pending_job
 # endregion
 
 
+# list of commands, with their description, shown to the users
+COMMANDS = [
+    BotCommand("start", "presentazione iniziale del bot"),
+    BotCommand("spot", "inizia a spottare"),
+    BotCommand("cancel ",
+               "annulla la procedura in corso e cancella l'ultimo spot inviato, se non è ancora stato pubblicato"),
+    BotCommand("help ", "funzionamento e scopo del bot"),
+    BotCommand("report", "segnala un utente"),
+    BotCommand("rules ", "regole da tenere a mente"),
+    BotCommand("stats", "visualizza statistiche sugli spot"),
+    BotCommand("settings", "cambia le impostazioni di privacy")
+]
+
+
 def add_commands(up: Updater):
     """Adds the list of commands with their description to the bot
 
     Args:
         up (Updater): supplyed Updater
     """
-    commands = [
-        BotCommand("start", "presentazione iniziale del bot"),
-        BotCommand("spot", "inizia a spottare"),
-        BotCommand("cancel ",
-                   "annulla la procedura in corso e cancella l'ultimo spot inviato, se non è ancora stato pubblicato"),
-        BotCommand("help ", "funzionamento e scopo del bot"),
-        BotCommand("report", "segnala un utente"),
-        BotCommand("rules ", "regole da tenere a mente"),
-        BotCommand("stats", "visualizza statistiche sugli spot"),
-        BotCommand("settings", "cambia le impostazioni di privacy")
-    ]
-    up.bot.set_my_commands(commands=commands)
+    up.bot.set_my_commands(commands=COMMANDS)
 
 
 def add_handlers(dp: Dispatcher):
@@ -57,8 +60,8 @@ def add_handlers(dp: Dispatcher):
     dp.add_handler(
         ConversationHandler(entry_points=[CommandHandler("spot", post_cmd)],
                             states={
-                                STATE['posting']: [MessageHandler(~Filters.command, post_msg)],
-                                STATE['confirm']: [CallbackQueryHandler(meme_callback, pattern=r"^meme_confirm\.*")]
+                                State.POSTING: [MessageHandler(~Filters.command, post_msg)],
+                                State.CONFIRM: [CallbackQueryHandler(meme_callback, pattern=r"^meme_confirm\.*")]
                             },
                             fallbacks=[CommandHandler("cancel", cancel_cmd)],
                             allow_reentry=False))
@@ -66,9 +69,9 @@ def add_handlers(dp: Dispatcher):
     dp.add_handler(
         ConversationHandler(entry_points=[CommandHandler("report", report_cmd)],
                             states={
-                                STATE['reporting_user']: [MessageHandler(~Filters.command, report_user_msg)],
-                                STATE['reporting_user_reason']: [MessageHandler(~Filters.command, report_user_msg)],
-                                STATE['sending_user_report']: [MessageHandler(~Filters.command, report_user_sent_msg)]
+                                State.REPORTING_USER: [MessageHandler(~Filters.command, report_user_msg)],
+                                State.REPORTING_USER_REASON: [MessageHandler(~Filters.command, report_user_msg)],
+                                State.SENDING_USER_REPORT: [MessageHandler(~Filters.command, report_user_sent_msg)]
                             },
                             fallbacks=[CommandHandler("cancel", cancel_cmd)],
                             allow_reentry=False))
@@ -76,7 +79,7 @@ def add_handlers(dp: Dispatcher):
     dp.add_handler(
         ConversationHandler(entry_points=[CallbackQueryHandler(meme_callback, pattern=r"^meme_report\.*")],
                             states={
-                                STATE['reporting_spot']: [MessageHandler(~Filters.command, report_post)],
+                                State.REPORTING_SPOT: [MessageHandler(~Filters.command, report_post)],
                             },
                             fallbacks=[CommandHandler("cancel", cancel_cmd)],
                             allow_reentry=False,
@@ -98,7 +101,8 @@ def add_handlers(dp: Dispatcher):
 
     # Callback handlers
     dp.add_handler(CallbackQueryHandler(meme_callback, pattern=r"^meme_\.*"))
-    dp.add_handler(CallbackQueryHandler(stats_callback, pattern=r"^stats_\.*"))
+    # the stats are read-only aggregate queries: run them in the worker pool, so they do not stall the other updates
+    dp.add_handler(CallbackQueryHandler(stats_callback, pattern=r"^stats_\.*", run_async=True))
 
     if config_map['meme']['comments']:
         dp.add_handler(MessageHandler(Filters.forwarded, forwarded_post_msg))
@@ -121,7 +125,9 @@ def main():
     add_handlers(updater.dispatcher)
     add_jobs(updater.dispatcher)
 
-    updater.start_polling()
+    # long polling: each getUpdates waits up to 30s for new updates
+    # only messages and callback queries are handled, so the other update types are not requested
+    updater.start_polling(timeout=30, allowed_updates=["message", "callback_query"])
     updater.idle()
 
 
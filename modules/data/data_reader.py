@@ -4,6 +4,9 @@ import yaml
 import re
 from telegram.utils.helpers import escape_markdown
 
+# use the libyaml C parser when available, since it is much faster than the pure python one
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def get_abs_path(*root_file_path: str) -> str:
     r"""Get the abs path from the root directory of the project to the requested path
@@ -69,10 +72,10 @@ def load_configuration(path: str, load_default: bool = True, force_load: bool =
     conf = {}
     if load_default and os.path.exists(f"{path}.dist"):
         with open(f"{path}.dist", 'r', encoding="utf-8") as conf_file:
-            conf.update(yaml.load(conf_file, Loader=yaml.SafeLoader))
+            conf.update(yaml.load(conf_file, Loader=SafeLoader))
     if force_load or os.path.exists(path):
         with open(path, 'r', encoding="utf-8") as conf_file:
-            conf.update(yaml.load(conf_file, Loader=yaml.SafeLoader))
+            conf.update(yaml.load(conf_file, Loader=SafeLoader))
     return conf
 
 
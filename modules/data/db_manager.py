@@ -1,6 +1,7 @@
 """Handles the management of databases"""
 import os
 import logging
+import threading
 from typing import Tuple
 import sqlite3
 from modules.data.data_reader import get_abs_path, read_file
@@ -13,6 +14,7 @@ class DbManager():
     """
     db_path = ("data", "db", "db.sqlite3")
     row_factory = lambda cursor, row: {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+    __local = threading.local()
 
     @classmethod
     def __query_execute(cls, cur: sqlite3.Cursor, query: str, args: tuple = None, error_str: str = "", is_many: bool = False):
@@ -37,15 +39,19 @@ class DbManager():
 
     @classmethod
     def get_db(cls) -> Tuple[sqlite3.Connection, sqlite3.Cursor]:
-        """Creates the connection to the database. It can be sqlite or postgres
+        """Gets the connection to the database, creating it the first time it is requested by the current thread.
+        The connection is kept open, so sqlite can reuse the statements it has already prepared
 
         Returns:
-            Tuple[sqlite3.Connection, sqlite3.Cursor]: sqlite database connection and cursor
+            Tuple[sqlite3.Connection, sqlite3.Cursor]: sqlite database connection and a new cursor
         """
-        db_path = get_abs_path(*cls.db_path)
-        if not os.path.exists(db_path):
-            open(db_path, 'w').close()
-        conn = sqlite3.connect(db_path)
+        conn = getattr(cls.__local, "conn", None)
+        if conn is None:
+            db_path = get_abs_path(*cls.db_path)
+            if not os.path.exists(db_path):
+                open(db_path, 'w').close()
+            conn = sqlite3.connect(db_path)
+            cls.__local.conn = conn
         conn.row_factory = cls.row_factory
         cur = conn.cursor()
         return conn, cur
@@ -64,7 +70,6 @@ class DbManager():
             cls.__query_execute(cur=cur, query=query, error_str="query_from_file")
         conn.commit()
         cur.close()
-        conn.close()
 
     @classmethod
     def query_from_string(cls, *queries: str):
@@ -80,7 +85,6 @@ class DbManager():
 
         conn.commit()
         cur.close()
-        conn.close()
 
     @classmethod
     def select_from(cls,
@@ -119,7 +123,6 @@ class DbManager():
         query_result = cur.fetchall()
         conn.commit()
         cur.close()
-        conn.close()
         return query_result
 
     @classmethod
@@ -149,7 +152,6 @@ class DbManager():
         query_result = cur.fetchall()
         conn.commit()
         cur.close()
-        conn.close()
         return query_result[0]['number'] if len(query_result) > 0 else None
 
     @classmethod
@@ -181,7 +183,6 @@ class DbManager():
 
         conn.commit()
         cur.close()
-        conn.close()
 
     @classmethod
     def delete_from(cls, table_name: str, where: str = "", where_args: tuple = None):
@@ -202,4 +203,3 @@ class DbManager():
 
         conn.commit()
         cur.close()
-        conn.close()
@@ -96,7 +96,7 @@ class PendingPost():
 
     @staticmethod
     def get_all_pending_memes(group_id: int, before: datetime = None) -> list:
-        """Gets the list of pending memes in the specified admin group.
+        """Gets the list of pending memes in the specified admin group, ordered by their id in the group.
         If before is specified, returns only the one sent before that timestamp
 
         Args:
@@ -104,23 +104,27 @@ class PendingPost():
             before (datetime, optional): timestamp before wich messages will be considered. Defaults to None.
 
         Returns:
-            List[type(PendingPost)]: list of ids of pending memes
+            List[PendingPost]: list of pending memes
         """
-        if datetime:
-            pending_posts_id = DbManager.select_from(select="g_message_id",
-                                                     table_name="pending_meme",
-                                                     where="group_id = %s and (message_date < %s or message_date IS NULL)",
-                                                     where_args=(group_id, before))
+        if before:
+            pending_posts = DbManager.select_from(select="*",
+                                                  table_name="pending_meme",
+                                                  where="group_id = %s and (message_date < %s or message_date IS NULL)",
+                                                  where_args=(group_id, before),
+                                                  order_by="g_message_id")
         else:
-            pending_posts_id = DbManager.select_from(select="g_message_id",
-                                                     table_name="pending_meme",
-                                                     where="group_id = %s",
-                                                     where_args=(group_id,))
-        pending_posts = []
-        for post in pending_posts_id:
-            g_message_id = int(post['g_message_id'])
-            pending_posts.append(PendingPost.from_group(group_id=group_id, g_message_id=g_message_id))
-        return pending_posts
+            pending_posts = DbManager.select_from(select="*",
+                                                  table_name="pending_meme",
+                                                  where="group_id = %s",
+                                                  where_args=(group_id,),
+                                                  order_by="g_message_id")
+        return [
+            PendingPost(user_id=pending_post['user_id'],
+                        u_message_id=pending_post['u_message_id'],
+                        group_id=pending_post['group_id'],
+                        g_message_id=pending_post['g_message_id'],
+                        date=pending_post['message_date']) for pending_post in pending_posts
+        ]
 
     def get_votes(self, vote: bool):
         """Gets all the votes of a specific kind (approve or reject)
@@ -166,8 +170,8 @@ class PendingPost():
         text = "Approvato da:\n" if approve else "Rifiutato da:\n"
         tag = '@' if config_map['meme']['tag'] else ''
         for admin in admins:
-            username = bot.get_chat(admin).username
-            text += f"{tag}{username}\n" if username else f"{bot.get_chat(admin).first_name}\n"
+            admin_chat = bot.get_chat(admin)  # one request per admin, reused for both username and first name
+            text += f"{tag}{admin_chat.username}\n" if admin_chat.username else f"{admin_chat.first_name}\n"
 
         bot.edit_message_reply_markup(chat_id=self.group_id, message_id=self.g_message_id, reply_markup=None)
         bot.send_message(chat_id=self.group_id, text=text, reply_to_message_id=self.g_message_id)
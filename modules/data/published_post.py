@@ -120,6 +120,7 @@ class PublishedPost():
         DbManager.delete_from(table_name="votes",
                               where="c_message_id = %s and channel_id = %s",
                               where_args=(self.c_message_id, self.channel_id))
+        votes = []
         ids = -1
         for row in keyboard.inline_keyboard:
             for column in row:
@@ -128,9 +129,15 @@ class PublishedPost():
                     n_votes = int(column.text.split(" ")[1])
                     vote = data.split(",")[1]
                     for _ in range(n_votes):
-                        self.set_user_vote(user_id=ids, vote=vote)
+                        votes.append((ids, self.c_message_id, self.channel_id, vote))
                         ids -= 1
 
+        if votes:  # all the votes are inserted at once
+            DbManager.insert_into(table_name="votes",
+                                  columns=("user_id", "c_message_id", "channel_id", "vote"),
+                                  values=votes,
+                                  multiple_rows=True)
+
     def __repr__(self):
         return f"PublishedPost: [ channel_id: {self.channel_id}\n"\
                 f"c_message_id: {self.c_message_id} ]"
@@ -1,4 +1,5 @@
 """Modules that handle the events the bot recognizes and reacts to"""
+from enum import IntEnum
 from modules.data import config_map
 
 CHAT_PRIVATE_ERROR = f"Non puoi usare quest comando ora\nChatta con {config_map['bot_tag']} in privato"
@@ -6,14 +7,17 @@ INVALID_MESSAGE_TYPE_ERROR = "Questo tipo di messaggio non è supportato\n"\
                                 "È consentito solo testo, stikers, immagini, audio, video o poll\n"\
                                 "Invia il post che vuoi pubblicare\n"\
                                 "Puoi annullare il processo con /cancel"
-STATE = {
-    'posting': 1,
-    'confirm': 2,
-    'reporting_spot': 3,
-    'reporting_user': 4,
-    'reporting_user_reason': 6,
-    'sending_user_report': 7,
-    'end': -1
-}
+
+
+class State(IntEnum):
+    """States of the conversations handled by the bot"""
+    POSTING = 1
+    CONFIRM = 2
+    REPORTING_SPOT = 3
+    REPORTING_USER = 4
+    REPORTING_USER_REASON = 6
+    SENDING_USER_REPORT = 7
+    END = -1
+
 
 purge_flag = False
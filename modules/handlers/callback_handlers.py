@@ -3,7 +3,7 @@ from typing import Tuple
 from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton
 from telegram.ext import CallbackContext
 from telegram.error import BadRequest, RetryAfter, Unauthorized
-from modules.handlers import STATE
+from modules.handlers import State
 from modules.debug import logger
 from modules.data import config_map, PendingPost, PublishedPost, PostData, Report, User
 from modules.utils import EventInfo
@@ -38,12 +38,11 @@ def meme_callback(update: Update, context: CallbackContext) -> int:
         int: value to return to the handler, if requested
     """
     info = EventInfo.from_callback(update, context)
-    data = old_reactions(info.query_data)
     # the callback data indicates the correct callback and the arg to pass to it separated by ,
-    data = data.split(",")
+    callback_key, _, arg = old_reactions(info.query_data).partition(",")
     try:
         # call the correct function
-        message_text, reply_markup, output = globals()[f'{data[0][5:]}_callback'](info, data[1])
+        message_text, reply_markup, output = globals()[f'{callback_key[5:]}_callback'](info, arg)
 
     except KeyError as e:
         message_text = reply_markup = output = None
@@ -79,7 +78,7 @@ def confirm_callback(info: EventInfo, arg: str) -> Tuple[str, InlineKeyboardMark
     """
     if arg == "yes":  # if the the user wants to publish the post
         if User(info.user_id).is_pending:  # there is already a spot in pending by this user
-            return None, None, STATE['end']
+            return None, None, State.END
 
         if info.send_post_to_admins():
             text = "Il tuo post è in fase di valutazione\n"\
@@ -94,7 +93,7 @@ def confirm_callback(info: EventInfo, arg: str) -> Tuple[str, InlineKeyboardMark
         text = None
         logger.error("confirm_callback: invalid arg '%s'", arg)
 
-    return text, None, STATE['end']
+    return text, None, State.END
 
 
 def settings_callback(info: EventInfo, arg: str) -> Tuple[str, InlineKeyboardMarkup, int]:
@@ -157,7 +156,7 @@ def approve_status_callback(info: EventInfo, arg: None) -> Tuple[str, InlineKeyb
         keyboard = None
         logger.error("confirm_callback: invalid arg '%s'", arg)
 
-    return None, keyboard, STATE['end']
+    return None, keyboard, State.END
 
 
 def approve_yes_callback(info: EventInfo, arg: None) -> Tuple[str, InlineKeyboardMarkup, int]:  # pylint: disable=unused-argument
@@ -285,7 +284,7 @@ def report_spot_callback(info: EventInfo, args: str) -> Tuple[str, InlineKeyboar
                                     c_message_id=abusive_message_id)
     if report is not None:  # this user has already reported this post
         info.answer_callback_query(text="Hai già segnalato questo spot.")
-        return None, None, STATE['end']
+        return None, None, State.END
     try:
         info.bot.forward_message(chat_id=info.user_id, from_chat_id=info.chat_id, message_id=abusive_message_id)
         info.bot.send_message(chat_id=info.user_id,
@@ -295,8 +294,8 @@ def report_spot_callback(info: EventInfo, args: str) -> Tuple[str, InlineKeyboar
         info.answer_callback_query(text=f"Assicurati di aver avviato la chat con {config_map['bot_tag']}")
         return None, None, None
 
-    info.user_data['current_post_reported'] = f"{info.chat_id},{abusive_message_id}"
-    return None, None, STATE['reporting_spot']
+    info.user_data['current_post_reported'] = (info.chat_id, abusive_message_id)
+    return None, None, State.REPORTING_SPOT
 
 
 # endregion
@@ -312,9 +311,9 @@ def stats_callback(update: Update, context: CallbackContext):
     info = EventInfo.from_callback(update, context)
     info.answer_callback_query()  # end the spinning progress bar
     # the callback data indicates the correct callback and the arg to pass to it separated by ,
-    data = info.query_data.split(",")
+    callback_key, _, arg = info.query_data.partition(",")
     try:
-        message_text = globals()[f'{data[0][6:]}_callback'](data[1])  # call the function based on its name
+        message_text = globals()[f'{callback_key[6:]}_callback'](arg)  # call the function based on its name
     except KeyError as e:
         logger.error("stats_callback: %s", e)
         return
@@ -4,7 +4,7 @@ import threading
 from modules.data.db_manager import DbManager
 from telegram import Update, ParseMode
 from telegram.ext import CallbackContext
-from modules.handlers import STATE, CHAT_PRIVATE_ERROR, INVALID_MESSAGE_TYPE_ERROR, purge_flag
+from modules.handlers import State, CHAT_PRIVATE_ERROR, INVALID_MESSAGE_TYPE_ERROR, purge_flag
 from modules.handlers.job_handlers import clean_pending_job
 from modules.data import config_map, read_md, PendingPost, Report, User
 from modules.utils import EventInfo
@@ -88,18 +88,18 @@ def post_cmd(update: Update, context: CallbackContext) -> int:
     user = User(info.user_id)
     if not info.is_private_chat:  # you can only post from a private chat
         info.bot.send_message(chat_id=info.chat_id, text=CHAT_PRIVATE_ERROR)
-        return STATE['end']
+        return State.END
 
     if user.is_banned:  # the user is banned
         info.bot.send_message(chat_id=info.chat_id, text="Sei stato bannato 😅")
-        return STATE['end']
+        return State.END
 
     if user.is_pending:  # there is already a post in pending
         info.bot.send_message(chat_id=info.chat_id, text="Hai già un post in approvazione 🧐")
-        return STATE['end']
+        return State.END
 
     info.bot.send_message(chat_id=info.chat_id, text="Invia il post che vuoi pubblicare")
-    return STATE['posting']
+    return State.POSTING
 
 
 def ban_cmd(update: Update, context: CallbackContext):
@@ -206,8 +206,8 @@ def clean_pending_cmd(update: Update, context: CallbackContext):
         update (Update): update event
         context (CallbackContext): context passed by the handler
     """
-    info = EventInfo.from_message(update, context)
-    if info.chat_id == config_map['meme']['group_id']:  # you have to be in the admin group
+    message = update.effective_message  # the command may also come from an edited message
+    if message is not None and message.chat_id == config_map['meme']['group_id']:  # you have to be in the admin group
         clean_pending_job(context=context)
 
 
@@ -264,7 +264,7 @@ def cancel_cmd(update: Update, context: CallbackContext) -> int:
     """
     info = EventInfo.from_message(update, context)
     if not info.is_private_chat:  # you can only cancel a post with a private message
-        return STATE['end']
+        return State.END
     pending_post = PendingPost.from_user(user_id=info.user_id)
     if pending_post:  # if the user has a pending post in evaluation, delete it
         group_id = pending_post.group_id
@@ -275,7 +275,7 @@ def cancel_cmd(update: Update, context: CallbackContext) -> int:
         info.bot.send_message(chat_id=info.chat_id, text="Lo spot precedentemente inviato è stato cancellato")
     else:
         info.bot.send_message(chat_id=info.chat_id, text="Operazione annullata")
-    return STATE['end']
+    return State.END
 
 
 def stats_cmd(update: Update, context: CallbackContext):
@@ -310,18 +310,14 @@ def post_msg(update: Update, context: CallbackContext) -> int:
     info = EventInfo.from_message(update, context)
 
     if not info.is_valid_message_type:  # the type is NOT supported
-        info.bot.send_message(
-            chat_id=info.chat_id,
-            text=
-            "Questo tipo di messaggio non è supportato\nÈ consentito solo testo, stikers, immagini, audio, video o poll\n"\
-            "Invia il post che vuoi pubblicare\nPuoi annullare il processo con /cancel")
-        return STATE['posting']
+        info.bot.send_message(chat_id=info.chat_id, text=INVALID_MESSAGE_TYPE_ERROR)
+        return State.POSTING
 
     info.bot.send_message(chat_id=info.chat_id,
                           text="Sei sicuro di voler publicare questo post?",
                           reply_to_message_id=info.message_id,
                           reply_markup=get_confirm_kb())
-    return STATE['confirm']
+    return State.CONFIRM
 
 
 def forwarded_post_msg(update: Update, context: CallbackContext):
@@ -332,14 +328,15 @@ def forwarded_post_msg(update: Update, context: CallbackContext):
         update (Update): update event
         context (CallbackContext): context passed by the handler
     """
-    info = EventInfo.from_message(update, context)
-    if update.message is None or update.message.forward_from_chat is None:
+    message = update.message
+    if message is None or message.forward_from_chat is None:
         return
 
-    if info.chat_id == config_map['meme']['channel_group_id']\
-        and info.forward_from_chat_id == config_map['meme']['channel_id']\
-        and info.user_name == "Telegram":
-        info.send_post_to_channel_group()
+    meme_config = config_map['meme']
+    if message.chat_id == meme_config['channel_group_id']\
+        and message.forward_from_chat.id == meme_config['channel_id']\
+        and message.from_user.name == "Telegram":
+        EventInfo.from_message(update, context).send_post_to_channel_group()
 
 
 # endregion
@@ -361,15 +358,15 @@ def report_post(update: Update, context: CallbackContext) -> int:
     info = EventInfo.from_message(update, context)
 
     if not info.is_private_chat:
-        return STATE['reporting_spot']
+        return State.REPORTING_SPOT
 
     if not info.is_valid_message_type:  # the type is NOT supported
         info.bot.send_message(chat_id=info.chat_id, text=INVALID_MESSAGE_TYPE_ERROR)
-        return STATE['reporting_spot']
+        return State.REPORTING_SPOT
 
     chat_id = config_map['meme']['group_id']  # should be admin group
 
-    channel_id, target_message_id = context.user_data['current_post_reported'].split(",")
+    channel_id, target_message_id = context.user_data['current_post_reported']
 
     info.bot.forward_message(chat_id=chat_id, from_chat_id=channel_id, message_id=target_message_id)
     admin_message = info.bot.sendMessage(chat_id=chat_id, text="🚨🚨 SEGNALAZIONE 🚨🚨\n\n" + info.text)
@@ -381,7 +378,7 @@ def report_post(update: Update, context: CallbackContext) -> int:
                               c_message_id=target_message_id,
                               admin_message=admin_message)
 
-    return STATE['end']
+    return State.END
 
 
 # endregion
@@ -403,7 +400,7 @@ def report_cmd(update: Update, context: CallbackContext) -> int:
     info = EventInfo.from_message(update, context)
     if not info.is_private_chat:  # you can only post with a private message
         info.bot.send_message(chat_id=info.chat_id, text=CHAT_PRIVATE_ERROR)
-        return STATE['end']
+        return State.END
 
     user_report = Report.get_last_user_report(user_id=info.user_id)
 
@@ -413,11 +410,11 @@ def report_cmd(update: Update, context: CallbackContext) -> int:
 
         if remain_minutes > 0:
             info.bot.send_message(chat_id=info.chat_id, text=f"Aspetta {remain_minutes} minuti.")
-            return STATE['end']
+            return State.END
 
     info.bot.send_message(chat_id=info.chat_id, text="Invia l'username di chi vuoi segnalare. Es. @massimobene")
 
-    return STATE['reporting_user']
+    return State.REPORTING_USER
 
 
 def report_user_msg(update: Update, context: CallbackContext) -> int:
@@ -439,7 +436,7 @@ def report_user_msg(update: Update, context: CallbackContext) -> int:
             chat_id=info.chat_id,
             text="Questo tipo di messaggio non è supportato\n"\
                 "È consentito solo username telegram. Puoi annullare il processo con /cancel")
-        return STATE['reporting_user']
+        return State.REPORTING_USER
 
     context.user_data['current_report_target'] = info.text
 
@@ -450,7 +447,7 @@ def report_user_msg(update: Update, context: CallbackContext) -> int:
             f"dopo {config_map['meme']['report_wait_mins']} minuti.\n"\
             "Puoi annullare il processo con /cancel")
 
-    return STATE['sending_user_report']
+    return State.SENDING_USER_REPORT
 
 
 def report_user_sent_msg(update: Update, context: CallbackContext) -> int:
@@ -467,7 +464,7 @@ def report_user_sent_msg(update: Update, context: CallbackContext) -> int:
     info = EventInfo.from_message(update, context)
     if not info.is_valid_message_type:  # the type is NOT supported
         info.bot.send_message(chat_id=info.chat_id, text=INVALID_MESSAGE_TYPE_ERROR)
-        return STATE['sending_user_report']
+        return State.SENDING_USER_REPORT
 
     target_username = context.user_data['current_report_target']
 
@@ -480,7 +477,7 @@ def report_user_sent_msg(update: Update, context: CallbackContext) -> int:
 
     Report.create_user_report(user_id=info.user_id, target_username=target_username, admin_message=admin_message)
 
-    return STATE['end']
+    return State.END
 
 
 # endregion
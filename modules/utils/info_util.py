@@ -1,170 +1,163 @@
 """Common info needed in both command and callback handlers"""
-from telegram import Bot, Update, Message, CallbackQuery, ReplyMarkup, Chat, InlineKeyboardMarkup
+from operator import attrgetter
+from telegram import Bot, Update, Message, CallbackQuery, Chat, InlineKeyboardMarkup
 from telegram.ext import CallbackContext
 from telegram.error import BadRequest
 from modules.debug.log_manager import logger
 from modules.data import config_map, PendingPost, PublishedPost, User
 from modules.utils.keyboard_util import get_approve_kb, get_vote_kb
 
+# attributes of a message, at least one of which must be set for the message type to be supported
+VALID_MESSAGE_TYPES = attrgetter("text", "photo", "voice", "audio", "video", "animation", "sticker", "poll")
+# text of a poll option
+OPTION_TEXT = attrgetter("text")
+
 
 class EventInfo():
     """Class that contains all the relevant information related to an event
     """
 
+    __slots__ = ("_bot", "_ctx", "_update", "_message", "_query")
+
     def __init__(self,
                  bot: Bot,
                  ctx: CallbackContext,
                  update: Update = None,
                  message: Message = None,
                  query: CallbackQuery = None):
-        self.__bot = bot
-        self.__ctx = ctx
-        self.__update = update
-        self.__message = message
-        self.__query = query
+        self._bot = bot
+        self._ctx = ctx
+        self._update = update
+        self._message = message
+        self._query = query
 
     @property
     def bot(self) -> Bot:
         """:class:`telegram.Bot`: Istance of the telegram bot"""
-        return self.__bot
+        return self._bot
 
     @property
     def context(self) -> CallbackContext:
         """:class:`telegram.ext.CallbackContext`: Context generated by some event"""
-        return self.__ctx
+        return self._ctx
 
     @property
     def update(self) -> Update:
         """:class:`telegram.update.Update`: Update generated by some event. Defaults to None"""
-        return self.__update
+        return self._update
 
     @property
     def message(self) -> Message:
         """:class:`telegram.Message`: Message that caused the update. Defaults to None"""
-        return self.__message
+        return self._message
 
     @property
     def bot_data(self) -> dict:
         """:class:`dict`: Data related to the bot. Is not persistent between restarts"""
-        return self.__ctx.bot_data
+        return self._ctx.bot_data
 
     @property
     def user_data(self) -> dict:
         """:class:`dict`: Data related to the user. Is not persistent between restarts"""
-        return self.__ctx.user_data
+        return self._ctx.user_data
 
-    @property
-    def chat_id(self) -> int:
-        """:class:`int`: Id of the chat where the event happened. Defaults to None"""
-        if self.__message is None:
-            return None
-        return self.__message.chat_id
+    def _message_property(path: str, doc: str) -> property:  # pylint: disable=no-self-argument
+        """Generates a read-only property that returns the attribute found in path of the message
+        that caused the update, or None if there is no message.
+        Only used while creating the class
 
-    @property
-    def chat_type(self) -> str:
-        """:class:`str`: Type of the chat where the event happened. Defaults to None"""
-        if self.__message is None:
-            return None
-        return self.__message.chat.type
+        Args:
+            path (str): attribute of the message, in the dotted notation supported by :func:`operator.attrgetter`
+            doc (str): docstring of the property
+
+        Returns:
+            property: generated property
+        """
+        get_attribute = attrgetter(path)
+
+        def getter(self):
+            message = self._message
+            return None if message is None else get_attribute(message)
+
+        return property(getter, doc=doc)
+
+    chat_id = _message_property("chat_id", ":class:`int`: Id of the chat where the event happened. Defaults to None")
+    chat_type = _message_property("chat.type",
+                                  ":class:`str`: Type of the chat where the event happened. Defaults to None")
+    text = _message_property("text", ":class:`str`: Text of the message that caused the update. Defaults to None")
+    message_id = _message_property("message_id",
+                                   ":class:`int`: Id of the message that caused the update. Defaults to None")
+    reply_markup = _message_property(
+        "reply_markup",
+        ":class:`telegram.ReplyMarkup`: Reply_markup of the message that caused the update. Defaults to None")
+    inline_keyboard = _message_property(
+        "reply_markup", ":class:`InlineKeyboardMarkup`: InlineKeyboard attached to the message. Defaults to None")
+    forward_from_id = _message_property(
+        "forward_from_message_id", ":class:`int`: Id of the original message that has been forwarded. Defaults to None")
+    del _message_property
 
     @property
     def is_private_chat(self) -> bool:
         """:class:`bool`: Whether the chat is private or not
         """
-        if self.chat_type is None:
-            return None
-        return self.chat_type == Chat.PRIVATE
-
-    @property
-    def text(self) -> str:
-        """:class:`str`: Text of the message that caused the update. Defaults to None"""
-        if self.__message is None:
+        if self._message is None:
             return None
-        return self.__message.text
-
-    @property
-    def message_id(self) -> int:
-        """:class:`int`: Id of the message that caused the update. Defaults to None"""
-        if self.__message is None:
-            return None
-        return self.__message.message_id
+        return self._message.chat.type == Chat.PRIVATE
 
     @property
     def is_valid_message_type(self) -> bool:
         """:class:`bool`: Whether or not the type of the message is supported"""
-        if self.__message is None:
-            return None
-        return self.__message.text or self.__message.photo or self.__message.voice or self.__message.audio\
-        or self.__message.video or self.__message.animation or self.__message.sticker or self.__message.poll
-
-    @property
-    def reply_markup(self) -> ReplyMarkup:
-        """:class:`telegram.ReplyMarkup`: Reply_markup of the message that caused the update. Defaults to None"""
-        if self.__message is None:
+        if self._message is None:
             return None
-        return self.__message.reply_markup
+        return any(VALID_MESSAGE_TYPES(self._message))
 
     @property
     def user_id(self) -> int:
         """:class:`int`: Id of the user that caused the update. Defaults to None"""
-        if self.__query is not None:
-            return self.__query.from_user.id
-        if self.__message is not None:
-            return self.__message.from_user.id
+        if self._query is not None:
+            return self._query.from_user.id
+        if self._message is not None:
+            return self._message.from_user.id
         return None
 
     @property
     def user_username(self) -> int:
         """:class:`int`: Username of the user that caused the update. Defaults to None"""
-        if self.__query is not None:
-            return self.__query.from_user.username
-        if self.__message is not None:
-            return self.__message.from_user.username
+        if self._query is not None:
+            return self._query.from_user.username
+        if self._message is not None:
+            return self._message.from_user.username
         return None
 
     @property
     def user_name(self) -> str:
         """:class:`str`: Name of the user that caused the update. Defaults to None"""
-        if self.__query is not None:
-            return self.__query.from_user.name
-        if self.__message is not None:
-            return self.__message.from_user.name
+        if self._query is not None:
+            return self._query.from_user.name
+        if self._message is not None:
+            return self._message.from_user.name
         return None
 
-    @property
-    def inline_keyboard(self) -> InlineKeyboardMarkup:
-        """:class:`InlineKeyboardMarkup`: InlineKeyboard attached to the message. Defaults to None"""
-        if self.__message is None:
-            return None
-        return self.__message.reply_markup
-
     @property
     def query_id(self) -> int:
         """:class:`int`: Id of the query that caused the update. Defaults to None"""
-        if self.__query is None:
+        if self._query is None:
             return None
-        return self.__query.id
+        return self._query.id
 
     @property
     def query_data(self) -> str:
         """:class:`str`: Data associated with the query that caused the update. Defaults to None"""
-        if self.__query is None:
-            return None
-        return self.__query.data
-
-    @property
-    def forward_from_id(self) -> int:
-        """:class:`int`: Id of the original message that has been forwarded. Defaults to None"""
-        if self.__message is None:
+        if self._query is None:
             return None
-        return self.__message.forward_from_message_id
+        return self._query.data
 
     @property
     def forward_from_chat_id(self) -> int:
         """:class:`int`: Id of the original chat the message has been forwarded from. Defaults to None"""
-        if self.__message is None or self.__message.forward_from_chat is None:
+        if self._message is None or self._message.forward_from_chat is None:
             return None
-        return self.__message.forward_from_chat.id
+        return self._message.forward_from_chat.id
 
     @classmethod
     def from_message(cls, update: Update, ctx: CallbackContext):
@@ -211,7 +204,7 @@ class EventInfo():
             text (str, optional): Text to show to the user. Defaults to None.
         """
         try:
-            self.__bot.answer_callback_query(callback_query_id=self.query_id, text=text)
+            self._bot.answer_callback_query(callback_query_id=self.query_id, text=text)
         except BadRequest as e:
             logger.warning("On answer_callback_query: %s", e)
 
@@ -226,7 +219,7 @@ class EventInfo():
         chat_id = chat_id if chat_id is not None else self.chat_id
         message_id = message_id if message_id is not None else self.message_id
         try:
-            self.__bot.edit_message_reply_markup(chat_id=chat_id, message_id=message_id, reply_markup=new_keyboard)
+            self._bot.edit_message_reply_markup(chat_id=chat_id, message_id=message_id, reply_markup=new_keyboard)
         except (BadRequest) as e:
             logger.error("EventInfo.edit_inline_keyboard: %s", e)
 
@@ -236,29 +229,29 @@ class EventInfo():
         Returns:
             bool: whether or not the operation was successful
         """
-        message = self.__message.reply_to_message
+        message = self._message.reply_to_message
         group_id = config_map['meme']['group_id']
         poll = message.poll  # if the message is a poll, get its reference
 
         try:
             if poll:  # makes sure the poll is anonym
-                g_message_id = self.__bot.send_poll(chat_id=group_id,
-                                                    question=poll.question,
-                                                    options=[option.text for option in poll.options],
-                                                    type=poll.type,
-                                                    allows_multiple_answers=poll.allows_multiple_answers,
-                                                    correct_option_id=poll.correct_option_id,
-                                                    reply_markup=get_approve_kb()).message_id
+                g_message_id = self._bot.send_poll(chat_id=group_id,
+                                                   question=poll.question,
+                                                   options=list(map(OPTION_TEXT, poll.options)),
+                                                   type=poll.type,
+                                                   allows_multiple_answers=poll.allows_multiple_answers,
+                                                   correct_option_id=poll.correct_option_id,
+                                                   reply_markup=get_approve_kb()).message_id
             elif message.text and message.entities:  # mantains the previews, if present
-                g_message_id = self.__bot.send_message(chat_id=group_id,
-                                                       text=message.text,
-                                                       entities=message.entities,
-                                                       reply_markup=get_approve_kb()).message_id
+                g_message_id = self._bot.send_message(chat_id=group_id,
+                                                      text=message.text,
+                                                      entities=message.entities,
+                                                      reply_markup=get_approve_kb()).message_id
             else:
-                g_message_id = self.__bot.copy_message(chat_id=group_id,
-                                                       from_chat_id=message.chat_id,
-                                                       message_id=message.message_id,
-                                                       reply_markup=get_approve_kb()).message_id
+                g_message_id = self._bot.copy_message(chat_id=group_id,
+                                                      from_chat_id=message.chat_id,
+                                                      message_id=message.message_id,
+                                                      reply_markup=get_approve_kb()).message_id
         except (BadRequest) as e:
             logger.error("Sending the post on send_post_to: %s", e)
             return False
@@ -271,43 +264,44 @@ class EventInfo():
         """Sends the post to  the channel, so it can be ejoyed by the users (and voted, if comments are disabled)
         """
         user = User(user_id)
-        message = self.__message
+        message = self._message
         channel_id = config_map['meme']['channel_id']
+        comments = config_map['meme']['comments']
 
         reply_markup = None
-        if not config_map['meme']['comments']:  # ... append the voting Inline Keyboard, if comments are not to be supported
+        if not comments:  # ... append the voting Inline Keyboard, if comments are not to be supported
             reply_markup = get_vote_kb()
 
         if message.text and message.entities:  # mantains the previews, if present
-            c_message_id = self.__bot.send_message(chat_id=channel_id,
-                                                   text=message.text,
-                                                   entities=message.entities,
-                                                   reply_markup=reply_markup).message_id
+            c_message_id = self._bot.send_message(chat_id=channel_id,
+                                                  text=message.text,
+                                                  entities=message.entities,
+                                                  reply_markup=reply_markup).message_id
         else:
-            c_message_id = self.__bot.copy_message(chat_id=channel_id,
-                                                   from_chat_id=message.chat_id,
-                                                   message_id=message.message_id,
-                                                   reply_markup=reply_markup).message_id
+            c_message_id = self._bot.copy_message(chat_id=channel_id,
+                                                  from_chat_id=message.chat_id,
+                                                  message_id=message.message_id,
+                                                  reply_markup=reply_markup).message_id
 
-        if not config_map['meme']['comments']:  # if the user can vote directly on the post
+        if not comments:  # if the user can vote directly on the post
             PublishedPost.create(c_message_id=c_message_id, channel_id=channel_id)
-            sign = user.get_user_sign(bot=self.__bot)
-            self.__bot.send_message(chat_id=channel_id, text=f"by: {sign}", reply_to_message_id=message.message_id)
+            sign = user.get_user_sign(bot=self._bot)
+            self._bot.send_message(chat_id=channel_id, text=f"by: {sign}", reply_to_message_id=message.message_id)
         else:  # ... else, if comments are enabled, save the user_id, so the user can be credited
-            self.bot_data[f"{channel_id},{c_message_id}"] = user_id
+            self.bot_data[(channel_id, c_message_id)] = user_id
 
     def send_post_to_channel_group(self):
         """Sends the post to the group associated to the channel, so that users can vote the post (if comments are enabled)
         """
-        message = self.__message
+        message = self._message
         channel_group_id = config_map['meme']['channel_group_id']
-        user_id = self.bot_data.pop(f"{self.forward_from_chat_id},{self.forward_from_id}", -1)
+        user_id = self.bot_data.pop((self.forward_from_chat_id, self.forward_from_id), -1)
         user = User(user_id)
 
-        sign = user.get_user_sign(bot=self.__bot)
-        post_message_id = self.__bot.send_message(chat_id=channel_group_id,
-                                                  text=f"by: {sign}",
-                                                  reply_markup=get_vote_kb(),
-                                                  reply_to_message_id=message.message_id).message_id
+        sign = user.get_user_sign(bot=self._bot)
+        post_message_id = self._bot.send_message(chat_id=channel_group_id,
+                                                 text=f"by: {sign}",
+                                                 reply_markup=get_vote_kb(),
+                                                 reply_to_message_id=message.message_id).message_id
 
         PublishedPost.create(channel_id=channel_group_id, c_message_id=post_message_id)
@@ -1,6 +1,7 @@
 """Creates the inlinekeyboard sent by the bot in its messages.
 Callback_data format: <callback_family>_<callback_name>,[arg]"""
 from typing import List
+from functools import lru_cache
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from modules.data import PendingPost, PublishedPost, config_reactions
 
@@ -8,8 +9,10 @@ REACTION = config_reactions['reactions']
 ROWS = config_reactions['rows']
 
 
+@lru_cache(maxsize=1)
 def get_confirm_kb() -> InlineKeyboardMarkup:
-    """Generates the InlineKeyboard to confirm the creation of the post
+    """Generates the InlineKeyboard to confirm the creation of the post.
+    The keyboard is static, so the same istance is returned each time
 
     Returns:
         InlineKeyboardMarkup: new inline keyboard
@@ -20,8 +23,10 @@ def get_confirm_kb() -> InlineKeyboardMarkup:
     ]])
 
 
+@lru_cache(maxsize=1)
 def get_settings_kb() -> InlineKeyboardMarkup:
-    """Generates the InlineKeyboard to edit the settings
+    """Generates the InlineKeyboard to edit the settings.
+    The keyboard is static, so the same istance is returned each time
 
     Returns:
         InlineKeyboardMarkup: new inline keyboard
@@ -32,8 +37,10 @@ def get_settings_kb() -> InlineKeyboardMarkup:
     ]])
 
 
+@lru_cache(maxsize=1)
 def get_stats_kb() -> InlineKeyboardMarkup:
-    """Generates the InlineKeyboard for the stats menu
+    """Generates the InlineKeyboard for the stats menu.
+    The keyboard is static, so the same istance is returned each time
 
     Returns:
         InlineKeyboardMarkup: new inline keyboard
@@ -66,8 +73,10 @@ def get_stats_kb() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=1)
 def get_approve_kb() -> InlineKeyboardMarkup:
-    """Generates the InlineKeyboard for the pending post
+    """Generates the InlineKeyboard for the pending post.
+    The keyboard is static, so the same istance is returned each time
 
     Returns:
         InlineKeyboardMarkup: new inline keyboard
@@ -104,7 +113,8 @@ def update_approve_kb(keyboard: List[List[InlineKeyboardButton]],
                       pending_post: PendingPost,
                       approve: int = -1,
                       reject: int = -1) -> InlineKeyboardMarkup:
-    """Updates the InlineKeyboard when the valutation of a pending post changes
+    """Updates the InlineKeyboard when the valutation of a pending post changes.
+    The keyboard passed is not modified
 
     Args:
         keyboard (List[List[InlineKeyboardButton]]): previous keyboard
@@ -115,12 +125,12 @@ def update_approve_kb(keyboard: List[List[InlineKeyboardButton]],
     Returns:
         InlineKeyboardMarkup: updated inline keyboard
     """
-    if approve >= 0:
-        keyboard[0][0].text = f"🟢 {approve}"
-    else:
-        keyboard[0][0].text = f"🟢 {pending_post.get_votes(vote=True)}"
-    if reject >= 0:
-        keyboard[0][1].text = f"🔴 {reject}"
-    else:
-        keyboard[0][1].text = f"🔴 {pending_post.get_votes(vote=False)}"
-    return InlineKeyboardMarkup(keyboard)
+    if approve < 0:
+        approve = pending_post.get_votes(vote=True)
+    if reject < 0:
+        reject = pending_post.get_votes(vote=False)
+    # new buttons are created, since the previous keyboard may be a cached one
+    return InlineKeyboardMarkup([[
+        InlineKeyboardButton(f"🟢 {approve}", callback_data=keyboard[0][0].callback_data),
+        InlineKeyboardButton(f"🔴 {reject}", callback_data=keyboard[0][1].callback_data)
+    ], *keyboard[1:]])
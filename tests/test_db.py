@@ -1,4 +1,5 @@
 """Test all the modules related to data management"""
+import threading
 from modules.data.db_manager import DbManager
 
 TABLE_NAME = "test_table"
@@ -14,6 +15,20 @@ class TestDB:
         assert cur is not None
 
 
+    def test_get_db_same_thread(self, db_results):
+        """Tests that the get_db function reuses the connection in the same thread, but not in different ones
+        """
+        conn1, _ = DbManager.get_db()
+        conn2, _ = DbManager.get_db()
+        other_thread_conn = []
+        thread = threading.Thread(target=lambda: other_thread_conn.append(DbManager.get_db()[0]))
+        thread.start()
+        thread.join()
+
+        assert conn1 is conn2
+        assert other_thread_conn[0] is not conn1
+
+
     def test_query_from_string(self, db_results):
         """Tests the query_from_string function for the database
         """